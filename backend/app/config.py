@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./watchlist.db"
     watch_days: int = 5
     target_rate: float = 50.0
+    admin_token: str = ""
+    profile_dir: str = "./profiles"
+    profile_interval: float = 0.005
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
@@ -4,9 +4,11 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from app.database import init_db
 from app.routers.watchlist import router as watchlist_router
+from app.routers.admin import router as admin_router
+from app.services.profiler import ProfilingMiddleware
+from app.services.response_cache import CachedStaticFiles
 from app.services.scheduler import start_scheduler, stop_scheduler
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
@@ -25,7 +27,9 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title="키움 관심종목 관리 시스템", version="1.0.0", lifespan=lifespan)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(ProfilingMiddleware)
 app.include_router(watchlist_router)
+app.include_router(admin_router)
 
 
 @app.get("/api/health")
@@ -36,4 +40,4 @@ async def health_check():
 backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 frontend_path = os.path.join(backend_dir, "frontend")
 if os.path.exists(frontend_path):
-    app.mount("/", StaticFiles(directory=frontend_path, html=True), name="frontend")
+    app.mount("/", CachedStaticFiles(directory=frontend_path, html=True), name="frontend")
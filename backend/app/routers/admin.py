@@ -0,0 +1,79 @@
+"""관리자 전용 API 라우터 — 프로파일링 제어"""
+import os
+import secrets
+from datetime import date
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
+from app.database import get_db
+from app.models import DailyPrice
+from app.schemas import ProfilingArmRequest
+from app.services import profiler
+from app.services.scheduler import is_after_scheduled_run_time, is_daily_check_running, run_dry_daily_check, trigger_daily_check_now
+
+settings = get_settings()
+
+
+async def require_admin(x_admin_token: str = Header("")):
+    if not settings.admin_token or not secrets.compare_digest(x_admin_token.encode(), settings.admin_token.encode()):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiling")
+async def get_profiling_status():
+    return profiler.status()
+
+
+@router.post("/profiling/requests")
+async def arm_request_profiling(req: ProfilingArmRequest):
+    if req.count < 1 or not req.route.startswith("/"):
+        raise HTTPException(status_code=400, detail="route 는 '/' 로 시작하고 count 는 1 이상이어야 합니다")
+    profiler.arm_requests(req.route, req.count)
+    return {"message": f"다음 {req.count}건의 {req.route} 요청을 프로파일링합니다"}
+
+
+@router.post("/profiling/scheduler")
+async def arm_scheduler_profiling():
+    profiler.arm_scheduler()
+    return {"message": "다음 스케줄러 실행을 프로파일링합니다"}
+
+
+@router.delete("/profiling")
+async def disarm_profiling():
+    profiler.disarm()
+    return {"message": "예약된 프로파일링이 취소되었습니다"}
+
+
+@router.post("/profiling/daily-check", status_code=202)
+async def trigger_profiled_daily_check(background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
+    if is_daily_check_running():
+        raise HTTPException(status_code=409, detail="일일 시세 체크가 이미 실행 중입니다")
+    if profiler.is_active():
+        raise HTTPException(status_code=409, detail="다른 프로파일링이 진행 중입니다")
+    if not is_after_scheduled_run_time():
+        raise HTTPException(status_code=409, detail="평일 정기 실행 시각(20:05) 이후에만 실행할 수 있습니다")
+    recorded = (await db.execute(select(DailyPrice.id).where(DailyPrice.trade_date == date.today()).limit(1))).scalar_one_or_none()
+    if recorded:
+        try:
+            session = profiler.start("daily_price_check_dry_run")
+        except profiler.ProfilerBusy as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        background_tasks.add_task(run_dry_daily_check, session)
+        return {"message": "오늘 실행이 이미 완료되어 dry run(알림 없음, 롤백)으로 프로파일링합니다"}
+    try:
+        trigger_daily_check_now()
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {"message": "일일 시세 체크를 프로파일링과 함께 시작했습니다"}
+
+
+@router.get("/profiling/{name}")
+async def download_profile(name: str):
+    if name not in profiler.list_profiles():
+        raise HTTPException(status_code=404, detail="프로파일 결과를 찾을 수 없습니다")
+    return FileResponse(os.path.join(settings.profile_dir, name), filename=name)
@@ -2,13 +2,14 @@
 import logging
 from datetime import date, datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models import Watchlist, DailyPrice
 from app.schemas import WatchlistCreate, WatchlistResponse, WatchlistDetail, DailyPriceResponse, DashboardSummary
 from app.services.kiwoom_client import kiwoom_client
+from app.services.response_cache import bump_version, cached_response
 from app.services.telegram_bot import send_enrollment_notification, send_removal_notification, _send_to_all
 
 logger = logging.getLogger(__name__)
@@ -34,27 +35,33 @@ async def create_watchlist(req: WatchlistCreate, db: AsyncSession = Depends(get_
     db.add(watchlist)
     await db.flush()
     await db.refresh(watchlist)
+    await db.commit()
+    bump_version()
     await send_enrollment_notification(stock_name=stock_name, stock_code=stock_code, enrolled_date=watchlist.enrolled_date, d0_low_price=d0_low_price)
     return watchlist
 
 
 @router.get("/watchlist", response_model=list[WatchlistResponse])
-async def list_watchlist(status: Optional[str] = Query(None), db: AsyncSession = Depends(get_db)):
-    query = select(Watchlist).order_by(Watchlist.created_at.desc())
-    if status:
-        query = query.where(Watchlist.status == status)
-    result = await db.execute(query)
-    return list(result.scalars().all())
+async def list_watchlist(request: Request, status: Optional[str] = Query(None), db: AsyncSession = Depends(get_db)):
+    async def build():
+        query = select(Watchlist).order_by(Watchlist.created_at.desc())
+        if status:
+            query = query.where(Watchlist.status == status)
+        result = await db.execute(query)
+        return list(result.scalars().all())
+    return await cached_response(request, list[WatchlistResponse], build)
 
 
 @router.get("/watchlist/{stock_code}", response_model=WatchlistDetail)
-async def get_watchlist_detail(stock_code: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Watchlist).where(Watchlist.stock_code == stock_code).order_by(Watchlist.created_at.desc()).limit(1))
-    watchlist = result.scalar_one_or_none()
-    if not watchlist:
-        raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다")
-    prices_result = await db.execute(select(DailyPrice).where(DailyPrice.stock_code == stock_code).order_by(DailyPrice.trade_date.asc()))
-    return WatchlistDetail(watchlist=watchlist, daily_prices=list(prices_result.scalars().all()))
+async def get_watchlist_detail(request: Request, stock_code: str, db: AsyncSession = Depends(get_db)):
+    async def build():
+        result = await db.execute(select(Watchlist).where(Watchlist.stock_code == stock_code).order_by(Watchlist.created_at.desc()).limit(1))
+        watchlist = result.scalar_one_or_none()
+        if not watchlist:
+            raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다")
+        prices_result = await db.execute(select(DailyPrice).where(DailyPrice.stock_code == stock_code).order_by(DailyPrice.trade_date.asc()))
+        return WatchlistDetail(watchlist=watchlist, daily_prices=list(prices_result.scalars().all()))
+    return await cached_response(request, WatchlistDetail, build)
 
 
 @router.delete("/watchlist/{stock_code}")
@@ -66,29 +73,34 @@ async def delete_watchlist(stock_code: str, db: AsyncSession = Depends(get_db)):
     watchlist.status = "expired"
     watchlist.updated_at = datetime.now()
     await db.commit()
+    bump_version()
     await send_removal_notification(stock_name=watchlist.stock_name, stock_code=watchlist.stock_code)
     return {"message": f"{watchlist.stock_name} 관찰 종료됨"}
 
 
 @router.get("/dashboard/summary", response_model=DashboardSummary)
-async def get_dashboard_summary(db: AsyncSession = Depends(get_db)):
-    watching = (await db.execute(select(func.count()).select_from(Watchlist).where(Watchlist.status == "watching"))).scalar() or 0
-    alerted = (await db.execute(select(func.count()).select_from(Watchlist).where(Watchlist.status == "alerted"))).scalar() or 0
-    expired = (await db.execute(select(func.count()).select_from(Watchlist).where(Watchlist.status == "expired"))).scalar() or 0
-    total = (await db.execute(select(func.count()).select_from(Watchlist))).scalar() or 0
-    avg_peak_v = (await db.execute(select(func.avg(Watchlist.peak_rate)))).scalar()
-    finished = alerted + expired
-    success_rate = round((alerted / finished) * 100, 1) if finished > 0 else None
-    return DashboardSummary(watching_count=watching, alerted_count=alerted, expired_count=expired, total_count=total, avg_peak_rate=round(avg_peak_v, 2) if avg_peak_v else None, alert_success_rate=success_rate)
+async def get_dashboard_summary(request: Request, db: AsyncSession = Depends(get_db)):
+    async def build():
+        watching = (await db.execute(select(func.count()).select_from(Watchlist).where(Watchlist.status == "watching"))).scalar() or 0
+        alerted = (await db.execute(select(func.count()).select_from(Watchlist).where(Watchlist.status == "alerted"))).scalar() or 0
+        expired = (await db.execute(select(func.count()).select_from(Watchlist).where(Watchlist.status == "expired"))).scalar() or 0
+        total = (await db.execute(select(func.count()).select_from(Watchlist))).scalar() or 0
+        avg_peak_v = (await db.execute(select(func.avg(Watchlist.peak_rate)))).scalar()
+        finished = alerted + expired
+        success_rate = round((alerted / finished) * 100, 1) if finished > 0 else None
+        return DashboardSummary(watching_count=watching, alerted_count=alerted, expired_count=expired, total_count=total, avg_peak_rate=round(avg_peak_v, 2) if avg_peak_v else None, alert_success_rate=success_rate)
+    return await cached_response(request, DashboardSummary, build)
 
 
 @router.get("/dashboard/history", response_model=list[WatchlistResponse])
-async def get_history(status: Optional[str] = Query(None), db: AsyncSession = Depends(get_db)):
-    query = select(Watchlist).where(Watchlist.status.in_(["alerted", "expired"])).order_by(Watchlist.updated_at.desc())
-    if status and status in ("alerted", "expired"):
-        query = select(Watchlist).where(Watchlist.status == status).order_by(Watchlist.updated_at.desc())
-    result = await db.execute(query)
-    return list(result.scalars().all())
+async def get_history(request: Request, status: Optional[str] = Query(None), db: AsyncSession = Depends(get_db)):
+    async def build():
+        query = select(Watchlist).where(Watchlist.status.in_(["alerted", "expired"])).order_by(Watchlist.updated_at.desc())
+        if status and status in ("alerted", "expired"):
+            query = select(Watchlist).where(Watchlist.status == status).order_by(Watchlist.updated_at.desc())
+        result = await db.execute(query)
+        return list(result.scalars().all())
+    return await cached_response(request, list[WatchlistResponse], build)
 
 
 @router.delete("/history/{record_id}")
@@ -102,6 +114,7 @@ async def delete_history(record_id: int, db: AsyncSession = Depends(get_db)):
     stock_name = watchlist.stock_name
     await db.delete(watchlist)
     await db.commit()
+    bump_version()
     return {"message": f"{stock_name} 이력이 삭제되었습니다"}
 
 
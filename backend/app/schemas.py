@@ -47,3 +47,8 @@ class DashboardSummary(BaseModel):
     total_count: int
     avg_peak_rate: Optional[float] = None
     alert_success_rate: Optional[float] = None
+
+
+class ProfilingArmRequest(BaseModel):
+    route: str
+    count: int = 1
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Watchlist, DailyPrice
 from app.config import get_settings
 from app.services.kiwoom_client import kiwoom_client
+from app.services.response_cache import bump_version
 from app.services.telegram_bot import send_alert, send_expiration_notification
 
 logger = logging.getLogger(__name__)
@@ -23,7 +24,8 @@ def _count_business_days(start_date: date, end_date: date) -> int:
     return count
 
 
-async def process_daily_check(db: AsyncSession):
+async def process_daily_check(db: AsyncSession, dry_run: bool = False):
+    """dry_run=True 이면 텔레그램 전송 없이 실행 후 롤백 — 프로파일링용 재실행"""
     today = date.today()
     result = await db.execute(select(Watchlist).where(Watchlist.status == "watching"))
     watching_stocks: List[Watchlist] = list(result.scalars().all())
@@ -67,18 +69,25 @@ async def process_daily_check(db: AsyncSession):
                 stock.alerted_at = datetime.now()
                 stock.updated_at = datetime.now()
                 alerts_sent += 1
-                await send_alert(stock.stock_name, stock.stock_code, stock.enrolled_date,
-                                 stock.d0_low_price, close_price, change_rate, day_index)
+                if not dry_run:
+                    await send_alert(stock.stock_name, stock.stock_code, stock.enrolled_date,
+                                     stock.d0_low_price, close_price, change_rate, day_index)
             elif day_index >= settings.watch_days:
                 stock.status = "expired"
                 stock.updated_at = datetime.now()
                 expired_count += 1
-                await send_expiration_notification(stock.stock_name, stock.stock_code,
-                                                   stock.enrolled_date, stock.d0_low_price,
-                                                   stock.peak_rate, day_index)
+                if not dry_run:
+                    await send_expiration_notification(stock.stock_name, stock.stock_code,
+                                                       stock.enrolled_date, stock.d0_low_price,
+                                                       stock.peak_rate, day_index)
         except Exception as e:
             logger.error(f"종목 처리 오류: {stock.stock_name} - {e}")
             continue
 
+    if dry_run:
+        await db.rollback()
+        logger.info(f"일일 체크(dry run) 완료 — 변경사항 롤백: 알림 {alerts_sent}건, 만료 {expired_count}건")
+        return
     await db.commit()
+    bump_version()
     logger.info(f"일일 체크 완료: 알림 {alerts_sent}건, 만료 {expired_count}건")
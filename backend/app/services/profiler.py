@@ -0,0 +1,244 @@
+"""온디맨드 프로파일러 — 샘플링 스택(flamegraph folded 포맷) 및 asyncio 태스크 대기 시간 수집"""
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_active: Optional["ProfileSession"] = None
+_request_arm: Optional[Tuple[str, int]] = None
+_scheduler_armed = False
+
+
+class ProfilerBusy(RuntimeError):
+    pass
+
+
+def _frame_name(code) -> str:
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _fold(frame) -> str:
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _await_chain(coro) -> List[str]:
+    names = []
+    while coro is not None:
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        if code is None:
+            names.append(type(coro).__name__)
+            break
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        names.append(f"{getattr(code, 'co_qualname', code.co_name)}:{frame.f_lineno}" if frame else code.co_name)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return names
+
+
+class ProfileSession:
+    """이벤트 루프 스레드의 스택과 프로파일 대상 태스크(시작 태스크 + 그 하위 태스크)를 주기적으로 샘플링 — 각 샘플은 실제 경과 시간으로 가중"""
+
+    def __init__(self, label: str, interval: float):
+        self.label = label
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.awaits: Dict[str, Counter] = defaultdict(Counter)
+        self.samples = 0
+        self.skipped = 0
+        self.started_at = datetime.now()
+        self._t0 = time.perf_counter()
+        self.duration = 0.0
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        root = asyncio.current_task()
+        self._tasks: Tuple[asyncio.Task, ...] = (root,) if root else ()
+        self._prev_factory = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def start(self):
+        self._prev_factory = self._loop.get_task_factory()
+        self._loop.set_task_factory(self._track_task)
+        self._thread.start()
+
+    def stop(self):
+        self._loop.set_task_factory(self._prev_factory)
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._t0
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            try:
+                frame = sys._current_frames().get(self._thread_id)
+                stack = _fold(frame) if frame is not None else None
+                awaits = self._sample_tasks()
+            except Exception as e:
+                self.skipped += 1
+                if self.skipped == 1:
+                    logger.warning(f"프로파일 샘플 건너뜀: {self.label} - {e!r}")
+                continue
+            if stack is not None:
+                self.stacks[stack] += elapsed
+            for root, awaiting in awaits:
+                self.awaits[root][awaiting] += elapsed
+            self.samples += 1
+
+    def _track_task(self, loop, coro, **kwargs):
+        if self._prev_factory is not None:
+            task = self._prev_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        if asyncio.current_task(loop) in self._tasks:
+            self._tasks = self._tasks + (task,)
+        return task
+
+    def _sample_tasks(self) -> List[Tuple[str, str]]:
+        awaits = []
+        for task in self._tasks:
+            if task.done():
+                continue
+            chain = _await_chain(task.get_coro())
+            if not chain:
+                continue
+            root, *awaiting = chain
+            awaits.append((root.rsplit(":", 1)[0], " > ".join(awaiting) or "<running>"))
+        return awaits
+
+    def save(self) -> List[str]:
+        os.makedirs(settings.profile_dir, exist_ok=True)
+        base = f"{self.started_at:%Y%m%d_%H%M%S_%f}_{re.sub(r'[^A-Za-z0-9]+', '_', self.label).strip('_')}"
+        with open(os.path.join(settings.profile_dir, f"{base}.folded"), "w", encoding="utf-8") as f:
+            for stack, seconds in self.stacks.most_common():
+                f.write(f"{stack} {round(seconds * 1_000_000)}\n")
+        tasks = [
+            {"task": root, "awaiting": awaiting, "seconds": round(seconds, 4)}
+            for root, counter in self.awaits.items() for awaiting, seconds in counter.items()
+        ]
+        tasks.sort(key=lambda t: t["seconds"], reverse=True)
+        report = {"label": self.label, "started_at": self.started_at.isoformat(), "duration": round(self.duration, 4),
+                  "interval": self.interval, "samples": self.samples, "skipped": self.skipped, "tasks": tasks}
+        with open(os.path.join(settings.profile_dir, f"{base}.tasks.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return [f"{base}.folded", f"{base}.tasks.json"]
+
+
+def is_active() -> bool:
+    return _active is not None
+
+
+def start(label: str) -> ProfileSession:
+    global _active
+    if _active is not None:
+        raise ProfilerBusy(f"프로파일링 진행 중: {_active.label}")
+    _active = ProfileSession(label, settings.profile_interval)
+    _active.start()
+    logger.info(f"🔬 프로파일링 시작: {label}")
+    return _active
+
+
+async def finish(session: ProfileSession) -> List[str]:
+    global _active
+    session.stop()
+    if _active is session:
+        _active = None
+    try:
+        files = await asyncio.to_thread(session.save)
+    except Exception as e:
+        logger.error(f"프로파일 저장 실패: {session.label} - {e}")
+        return []
+    logger.info(f"🔬 프로파일링 완료: {session.label} ({session.duration:.2f}s, {session.samples} samples) → {files[0]}")
+    return files
+
+
+@asynccontextmanager
+async def profile(label: str):
+    session = start(label)
+    try:
+        yield session
+    finally:
+        await finish(session)
+
+
+def arm_requests(route: str, count: int):
+    global _request_arm
+    _request_arm = (route, count)
+
+
+def arm_scheduler():
+    global _scheduler_armed
+    _scheduler_armed = True
+
+
+def disarm():
+    global _request_arm, _scheduler_armed
+    _request_arm = None
+    _scheduler_armed = False
+
+
+def consume_scheduler_arm() -> bool:
+    global _scheduler_armed
+    if not _scheduler_armed or _active is not None:
+        return False
+    _scheduler_armed = False
+    return True
+
+
+def _matches_route(path: str, route: str) -> bool:
+    route = route.rstrip("/")
+    return path == route or path.startswith(route + "/")
+
+
+def _consume_request_arm(path: str) -> bool:
+    global _request_arm
+    route, remaining = _request_arm
+    if _active is not None or _matches_route(path, "/api/admin") or not _matches_route(path, route):
+        return False
+    _request_arm = (route, remaining - 1) if remaining > 1 else None
+    return True
+
+
+def status() -> Dict[str, Any]:
+    return {
+        "active": _active.label if _active else None,
+        "requests": {"route": _request_arm[0], "remaining": _request_arm[1]} if _request_arm else None,
+        "scheduler": _scheduler_armed,
+        "profiles": list_profiles(),
+    }
+
+
+def list_profiles() -> List[str]:
+    if not os.path.isdir(settings.profile_dir):
+        return []
+    return sorted((n for n in os.listdir(settings.profile_dir) if n.endswith((".folded", ".tasks.json"))), reverse=True)
+
+
+class ProfilingMiddleware:
+    """순수 ASGI 미들웨어 — 요청 프로파일링이 예약되지 않았으면 None 비교 한 번으로 통과"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if _request_arm is None or scope["type"] != "http" or not _consume_request_arm(scope["path"]):
+            return await self.app(scope, receive, send)
+        async with profile(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,106 @@
+"""응답 캐시 — 조회 API 직렬화 결과 캐싱, 쓰기 시 버전 증가로 무효화, ETag/304 및 gzip 지원"""
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import QueryParams
+from pydantic import TypeAdapter
+
+MAX_ENTRIES = 256
+GZIP_MIN_SIZE = 1024
+CACHE_CONTROL = "no-cache"
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_version = 0
+_entries: "OrderedDict[str, Tuple[int, str, bytes, Optional[bytes]]]" = OrderedDict()
+_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def bump_version():
+    """쓰기 경로에서 커밋 직후 호출 — 이전 버전으로 만든 캐시는 모두 무효"""
+    global _version
+    _version += 1
+    _entries.clear()
+
+
+def _adapter(model: Any) -> TypeAdapter:
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters[model] = TypeAdapter(model)
+    return adapter
+
+
+def _cache_key(request: Request) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}"
+
+
+def _gzip_etag(etag: str) -> str:
+    return f'{etag[:-1]}-gz"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if tag == "*" or tag == etag or tag == _gzip_etag(etag):
+            return True
+    return False
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for coding in accept_encoding.split(","):
+        name, *params = [p.strip() for p in coding.split(";")]
+        if name.lower() != "gzip":
+            continue
+        q = next((p[2:] for p in params if p.startswith("q=")), "1")
+        try:
+            return float(q) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _build_response(request: Request, etag: str, body: bytes, gzipped: Optional[bytes]) -> Response:
+    use_gzip = gzipped is not None and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {"ETag": _gzip_etag(etag) if use_gzip else etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gzipped, media_type="application/json", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def cached_response(request: Request, model: Any, build: Callable[[], Awaitable[Any]]) -> Response:
+    """캐시 적중 시 DB 조회 없이 직렬화된 본문 반환, 미스 시 build() 결과를 model 로 직렬화해 저장"""
+    key = _cache_key(request)
+    entry = _entries.get(key)
+    if entry and entry[0] == _version:
+        _entries.move_to_end(key)
+        return _build_response(request, *entry[1:])
+
+    version = _version
+    adapter = _adapter(model)
+    body = adapter.dump_json(adapter.validate_python(await build(), from_attributes=True))
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    gzipped = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_SIZE else None
+    if version == _version:
+        _entries[key] = (version, etag, body, gzipped)
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return _build_response(request, etag, body, gzipped)
+
+
+class CachedStaticFiles(StaticFiles):
+    """프론트엔드 정적 파일 — 버전 쿼리(?v=)가 붙은 자산만 장기 캐시, 나머지(HTML 포함)는 매번 재검증"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        versioned = not str(full_path).endswith(".html") and "v" in QueryParams(scope.get("query_string", b""))
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL if versioned else CACHE_CONTROL
+        return response
@@ -1,21 +1,65 @@
 """스케줄러 — 장 마감 후 자동 시세 수집"""
+import asyncio
 import logging
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.database import async_session
+from app.services import profiler
 from app.services.price_engine import process_daily_check
 
 logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler()
+KST = ZoneInfo("Asia/Seoul")
+DAILY_CHECK_TIME = time(20, 5)
+_daily_check_lock = asyncio.Lock()
+
+
+async def _run_daily_check(dry_run: bool = False):
+    async with _daily_check_lock:
+        try:
+            async with async_session() as db:
+                await process_daily_check(db, dry_run=dry_run)
+        except Exception as e:
+            logger.error(f"스케줄러 실행 오류: {e}")
 
 
 async def _scheduled_daily_check():
     logger.info("⏰ 스케줄러 실행: 일일 시세 체크 시작")
+    if profiler.consume_scheduler_arm():
+        async with profiler.profile("daily_price_check"):
+            await _run_daily_check()
+    else:
+        await _run_daily_check()
+
+
+def is_daily_check_running() -> bool:
+    return _daily_check_lock.locked()
+
+
+def is_after_scheduled_run_time() -> bool:
+    now = datetime.now(KST)
+    return now.weekday() < 5 and now.time() >= DAILY_CHECK_TIME
+
+
+def trigger_daily_check_now():
+    """등록된 daily_price_check 작업을 프로파일링과 함께 즉시 실행 — APScheduler max_instances=1 로 크론 실행과 중복 방지"""
+    job = scheduler.get_job("daily_price_check")
+    if job is None:
+        raise RuntimeError("스케줄러가 실행 중이 아닙니다")
+    profiler.arm_scheduler()
+    job.modify(next_run_time=datetime.now(KST))
+    logger.info("🔬 수동 실행 예약: 일일 시세 체크")
+
+
+async def run_dry_daily_check(session: profiler.ProfileSession):
+    """오늘 실행이 끝난 뒤 재현용 — 텔레그램 전송 없이 실행하고 롤백"""
+    logger.info("🔬 수동 실행: 일일 시세 체크 (dry run, 프로파일링)")
     try:
-        async with async_session() as db:
-            await process_daily_check(db)
-    except Exception as e:
-        logger.error(f"스케줄러 실행 오류: {e}")
+        await _run_daily_check(dry_run=True)
+    finally:
+        await profiler.finish(session)
 
 
 def start_scheduler():
@@ -23,8 +67,8 @@ def start_scheduler():
         _scheduled_daily_check,
         trigger=CronTrigger(
             day_of_week="mon-fri",
-            hour=20,
-            minute=5,
+            hour=DAILY_CHECK_TIME.hour,
+            minute=DAILY_CHECK_TIME.minute,
             timezone="Asia/Seoul",
         ),
         id="daily_price_check",